@@ -1,8 +1,22 @@
+import builtins
+import functools
 import inspect
+import re
+import types
+import weakref
 from enum import Enum
 from typing import Any, Callable, get_type_hints
 
 
+_MISSING = object()
+
+# Introspected parameters of each plain function, dropped once the function is garbage collected
+_SCHEMA_CACHE = weakref.WeakKeyDictionary()
+
+# Matches Google-style argument lines such as `location (str): The location ...`
+_ARG_RE = re.compile(r'^[ \t]*(\w+)[ \t]*\([^)\n]*\):[ \t]*(.+)$', re.MULTILINE)
+
+
 class TypeMappingEnum(Enum):
     """
     Enum class that maps Python types to JSON schema types.
@@ -23,6 +37,10 @@ class TypeMappingEnum(Enum):
     dict = 'object'
 
 
+# Python type -> JSON schema type, keyed by the type object itself
+_TYPE_MAP = {getattr(builtins, member.name): member.value for member in TypeMappingEnum}
+
+
 def function_to_tool_schema(func:Callable[..., Any]) -> dict:
     """
     Converts a Python function into a OpenAI tool calling schema representation.
@@ -52,50 +70,164 @@ def function_to_tool_schema(func:Callable[..., Any]) -> dict:
                 }
             }
         }
+
+    Notes:
+        Introspection runs once per function and is cached until the function is garbage
+        collected; bound methods share the entry of their underlying function. Each call
+        returns fresh containers, while default values are shared by reference.
     """
-    name = func.__name__
-    description = func.__doc__.strip().split("\n")[0] if func.__doc__ else "No description provided."
-    sig = inspect.signature(func)
-    parameters = sig.parameters
-    type_hints = get_type_hints(func)
+    # Bound methods carry `self`/`cls` as their first positional argument
+    return _assemble_tool_schema(_get_tool_params(func), skip_first=inspect.ismethod(func))
+
 
-    schema = {
+def _get_tool_params(func:Callable[..., Any]) -> tuple:
+    """
+    Returns the cached `_build_tool_params` result for `func`, keyed on the underlying
+    function so bound methods neither pin their instance nor miss the cache. Wrappers
+    made with `functools.wraps` (including `tool_schema_decorator`) are unwrapped first,
+    as `inspect.signature` does.
+    """
+    func = inspect.unwrap(func)
+    # Bound methods, staticmethods and classmethods hold the function in `__func__`
+    func = inspect.unwrap(getattr(func, '__func__', func))
+    try:
+        params = _SCHEMA_CACHE.get(func)
+    except TypeError:
+        # Not weak-referenceable or not hashable, so it cannot be cached
+        return _build_tool_params(func)
+
+    if params is None:
+        params = _SCHEMA_CACHE[func] = _build_tool_params(func)
+    return params
+
+
+def _assemble_tool_schema(params:tuple, skip_first:bool=False) -> dict:
+    """
+    Builds a new schema dict from the output of `_build_tool_params`, leaving out the
+    first parameter when `skip_first` is set.
+    """
+    name, description, parameters = params
+    if skip_first:
+        parameters = parameters[1:]
+
+    return {
         'type': 'function',
-        'function': None,
+        'function': {
+            "name": name,
+            "description": description,
+            "parameters": {
+                "type": "object",
+                "properties": {param_name: dict(param_schema) for param_name, param_schema, _ in parameters},
+                "required": [param_name for param_name, _, required in parameters if required],
+            }
+        },
     }
 
-    func_schema = {
-        "name": name,
-        "description": description,
-        "parameters": {
-            "type": "object",
-            "properties": {},
-            "required": [],
-        }
-    }
 
-    for param_name, param in parameters.items():
-        param_schema = {}
+def _resolve_type_hints(func:Callable[..., Any]) -> dict:
+    """
+    Returns the annotations of `func`, resolving string annotations (e.g. under
+    `from __future__ import annotations`) through `get_type_hints`. Only called while
+    building `_SCHEMA_CACHE` entries, so hints are resolved once per function.
+    """
+    annotations = func.__annotations__
+    if not any(isinstance(hint, str) for hint in annotations.values()):
+        return annotations
+    return get_type_hints(func)
 
-        param_type = type_hints.get(param_name, Any)#.__name__
-        param_schema["type"] = getattr(
-            TypeMappingEnum, param_type.__name__#, TypeMappingEnum.str.name
-        ).value
 
-        if func.__doc__ and f"{param_name} (" in func.__doc__:
-            start = func.__doc__.find(f"{param_name} (")
-            desc = func.__doc__[start:].split("):", 1)[-1].strip().split("\n")[0]
-            param_schema["description"] = desc
+def _build_tool_params(func:Callable[..., Any]) -> tuple:
+    """
+    Introspects `func` into `(name, description, parameters)`, where `parameters` is a
+    tuple of `(param_name, param_schema, required)` covering every positional and
+    keyword-only parameter. The result is cached and must not be mutated.
 
-        if param.default != inspect.Parameter.empty:
-            param_schema["default"] = param.default
+    Parameters are read straight from `__code__`, `__defaults__`, `__kwdefaults__` and
+    `__annotations__` rather than through `inspect.signature`; `get_type_hints` is only
+    used when some annotations are strings.
+    """
+    name = func.__name__
+    doc = func.__doc__ or ""
+    # Docstrings usually start with a newline, so strip before taking the first line
+    description = doc.strip().partition("\n")[0] if doc else "No description provided."
+
+    code = func.__code__
+    n_args = code.co_argcount
+    names = code.co_varnames[:n_args + code.co_kwonlyargcount]
+    defaults = func.__defaults__ or ()
+    default_offset = n_args - len(defaults)
+    kwdefaults = func.__kwdefaults__ or {}
+    type_hints = _resolve_type_hints(func)
+    param_docs = dict(_ARG_RE.findall(doc)) if doc else {}
+
+    parameters = []
+
+    for i in range(len(names)):
+        param_name = names[i]
+        if i < n_args:
+            default = defaults[i - default_offset] if i >= default_offset else _MISSING
         else:
-            func_schema["parameters"]["required"].append(param_name)
+            default = kwdefaults.get(param_name, _MISSING)
+
+        param_type = type_hints.get(param_name, Any)
+        # Generics such as `list[int]` or `typing.Dict[str, int]` map through their origin
+        param_type = _TYPE_MAP.get(getattr(param_type, '__origin__', param_type), TypeMappingEnum.str.value)
+        desc = param_docs.get(param_name)
+
+        # Build each property in a single dict literal
+        if desc and default is not _MISSING:
+            param_schema = {"type": param_type, "description": desc.strip(), "default": default}
+        elif desc:
+            param_schema = {"type": param_type, "description": desc.strip()}
+        elif default is not _MISSING:
+            param_schema = {"type": param_type, "default": default}
+        else:
+            param_schema = {"type": param_type}
+
+        parameters.append((param_name, param_schema, default is _MISSING))
 
-        func_schema["parameters"]["properties"][param_name] = param_schema
+    return name, description, tuple(parameters)
 
-    schema['function'] = func_schema
-    return schema
+
+class _ToolWrapper:
+    """
+    Callable wrapper returned by `tool_schema_decorator`. The OpenAI tool calling schema
+    is only built the first time `schema` is accessed, so decorating a function costs
+    nothing at import time. When defined in a class body the wrapper binds like the
+    function, `staticmethod` or `classmethod` it wraps, and its schema leaves out `self`
+    or `cls`.
+    """
+
+    def __init__(self, func:Callable[..., Any]):
+        functools.update_wrapper(self, func)
+        self._func = func
+        # staticmethod/classmethod objects are not callable before Python 3.10
+        self._call = func.__func__ if isinstance(func, (staticmethod, classmethod)) else func
+        self._is_method = False
+        self._schema = None
+
+    def __set_name__(self, owner, name):
+        # Only plain functions and classmethods receive an implicit first argument
+        self._is_method = isinstance(self._func, (types.FunctionType, classmethod))
+
+    def __call__(self, *args, **kwargs):
+        return self._call(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        # Bind like the wrapped function when used on methods
+        if isinstance(self._func, staticmethod):
+            return self
+        if isinstance(self._func, classmethod):
+            return types.MethodType(self, owner if owner is not None else type(instance))
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    @property
+    def schema(self) -> dict:
+        if self._schema is None:
+            self._schema = _assemble_tool_schema(_get_tool_params(self._func), skip_first=self._is_method)
+        return self._schema
 
 
 def tool_schema_decorator(func:Callable[..., Any]):
@@ -107,7 +239,8 @@ def tool_schema_decorator(func:Callable[..., Any]):
 
     Returns:
         Callable[..., Any]: The wrapped function with an additional `schema` attribute.
-                            The `schema` contains the function's OpenAI tool calling schema representation.
+                            The `schema` contains the function's OpenAI tool calling schema representation,
+                            computed lazily on first access.
 
     Example:
         @tool_schema_decorator
@@ -116,13 +249,7 @@ def tool_schema_decorator(func:Callable[..., Any]):
 
         add.schema -> OpenAI tool calling schema representation of the `add` function.
     """
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-
-    schema = function_to_tool_schema(func)
-
-    wrapper.schema = schema
-    return wrapper
+    return _ToolWrapper(func)
 
 
 def is_decorated(func):
@@ -136,19 +263,14 @@ def is_decorated(func):
         bool: True if the function is decorated, otherwise False.
 
     Notes:
-        This function checks whether the function is decorated by comparing
-        its `__name__` and `__qualname__` attributes.
+        This function checks for the `__wrapped__` attribute set by `functools.wraps`
+        (and by `tool_schema_decorator`), falling back to recognising plain closures
+        named `wrapper` that do not use `functools.wraps`.
     """
-    # if hasattr(func, '__wrapped__'):
-    #     return True
-
-    # if func.__closure__ is not None:
-    #     return True
-
-    if func.__name__ != func.__qualname__:
-        return True
-
-    return False
+    return (
+        getattr(func, '__wrapped__', None) is not None
+        or func.__qualname__.endswith('<locals>.wrapper')
+    )
 
 
 if __name__ == '__main__':
@@ -1,4 +1,5 @@
 from .openai import OpenAIWrapper
+from .async_openai import AsyncOpenAIWrapper
 from .compatible import OpenAICompatibleWrapper
 
-__all__ = ['OpenAIWrapper', 'OpenAICompatibleWrapper']
\ No newline at end of file
+__all__ = ['OpenAIWrapper', 'AsyncOpenAIWrapper', 'OpenAICompatibleWrapper']
\ No newline at end of file
@@ -0,0 +1,34 @@
+from openai import AsyncOpenAI
+
+from .compatible import OpenAICompatibleWrapper
+
+
+class AsyncOpenAIWrapper(OpenAICompatibleWrapper):
+    """
+    A wrapper class for the asynchronous OpenAI API client, merging default parameters into
+    every chat completion call while keeping the calls awaitable.
+
+    This class extends the OpenAICompatibleWrapper to interact with OpenAI's API through AsyncOpenAI,
+    so many chat completions can be in flight at once (e.g., with `asyncio.gather`).
+
+    Attributes:
+        base_client (AsyncOpenAI): An instance of the asynchronous OpenAI API client.
+        default_chat_params (dict): Default parameters for chat completions.
+        __original_create (function): A reference to the original create coroutine for chat completions in AsyncOpenAI.
+
+    Methods:
+        __getattr__(name):
+            Delegates attribute access to the underlying AsyncOpenAI client instance.
+
+    Args:
+        **chat_params (dict): Default parameters to be used for chat completions.
+    """
+
+    def __init__(self, **chat_params):
+        """
+        Initializes the AsyncOpenAIWrapper with default chat parameters.
+
+        Args:
+            **chat_params (dict): Default parameters to be used for chat completions.
+        """
+        super().__init__(AsyncOpenAI, **chat_params)
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+
+def _copy_with(model, **update):
+    """
+    Returns a copy of a response model with some fields replaced, for both pydantic v2
+    (`model_copy`) and pydantic v1 (`copy`) based clients.
+    """
+    if hasattr(model, 'model_copy'):
+        return model.model_copy(update=update)
+    return model.copy(update=update)
+
+
+class RequestCoalescer:
+    """
+    Coalesces identical chat completion requests that arrive within a short window into a
+    single request asking for `n` choices, then hands one choice back to each caller.
+
+    The chat completions API takes one conversation per request, so only requests with
+    identical parameters can share a call; `n` independent samples of the same prompt are
+    equivalent to `n` separate calls. Requests that set `n` or `stream`, or whose parameters
+    cannot be serialised to JSON, are sent on their own.
+
+    Notes:
+        - Responses split from one batch share its `id`, and their `usage` is set to None
+          since token usage is only reported for the whole batch.
+        - Identical requests that set `seed` now receive `n` different samples instead of
+          the same output for each call.
+
+    Attributes:
+        create (function): The coroutine function that performs a chat completion request.
+        window (float): How long, in seconds, a batch stays open after its first request.
+        max_size (int): The number of requests at which a batch is sent immediately.
+
+    Args:
+        create (function): The coroutine function that performs a chat completion request.
+        window_ms (float): How long, in milliseconds, a batch stays open after its first request.
+        max_size (int): The number of requests at which a batch is sent immediately.
+    """
+
+    def __init__(self, create, window_ms, max_size):
+        self.create = create
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._pending = {}
+        self._tasks = set()
+
+    async def submit(self, params):
+        """
+        Queues a request and waits for its response.
+
+        Args:
+            params (dict): The full set of parameters for the chat completion request.
+
+        Returns:
+            Response: A response holding a single choice, as if the request had been sent alone.
+        """
+        if 'n' in params or params.get('stream'):
+            return await self.create(**params)
+
+        try:
+            key = json.dumps(params, sort_keys=True)
+        except (TypeError, ValueError):
+            return await self.create(**params)
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            handle = loop.call_later(self.window, self._flush, key)
+            batch = self._pending[key] = (params, [], handle)
+        batch[1].append(future)
+
+        if len(batch[1]) >= self.max_size:
+            batch[2].cancel()
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key):
+        params, futures, _ = self._pending.pop(key)
+        # Keep a reference so the task is not garbage collected while running
+        task = asyncio.ensure_future(self._dispatch(params, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, params, futures):
+        if len(futures) == 1:
+            await self._resolve(futures[0], self.create(**params))
+            return
+
+        try:
+            response = await self.create(**params, n=len(futures))
+            choices = sorted(response.choices, key=lambda choice: choice.index)
+            results = [
+                _copy_with(response, choices=[_copy_with(choice, index=0)], usage=None)
+                for choice in choices
+            ]
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+        # Some compatible servers ignore `n`; send whatever is left on its own
+        await asyncio.gather(*(
+            self._resolve(future, self.create(**params)) for future in futures[len(choices):]
+        ))
+
+    @staticmethod
+    async def _resolve(future, coroutine):
+        try:
+            result = await coroutine
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(result)
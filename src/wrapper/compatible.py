@@ -1,3 +1,58 @@
+import inspect
+
+from .batching import RequestCoalescer
+
+
+def _bind_create(original_create, default_chat_params):
+    """
+    Builds the replacement for the original `create` method in `chat.completions`.
+
+    The original method and the default parameters are captured in a closure, so each call
+    only loads local variables instead of looking attributes up on the wrapper. The default
+    parameters dict is captured by reference, so in-place updates still apply.
+
+    Args:
+        original_create (function): The original `create` method of the base client.
+        default_chat_params (dict): Default parameters for chat completions.
+
+    Returns:
+        function: A `create` that merges the default parameters with the provided ones.
+    """
+    def create(**kwargs):
+        if not kwargs:
+            return original_create(**default_chat_params)
+
+        merged_params = default_chat_params.copy()
+        merged_params.update(kwargs)
+        return original_create(**merged_params)
+
+    return create
+
+
+def _bind_acreate(original_create, default_chat_params, coalescer=None):
+    """
+    Asynchronous counterpart of `_bind_create`, used when the base client is asynchronous
+    (e.g., AsyncOpenAI), so callers can run many chat completions concurrently.
+
+    Args:
+        original_create (function): The original `create` coroutine of the base client.
+        default_chat_params (dict): Default parameters for chat completions.
+        coalescer (RequestCoalescer): Batches identical requests, or None when batching is disabled.
+
+    Returns:
+        function: An awaitable `create` that merges the default parameters with the provided ones.
+    """
+    async def create(**kwargs):
+        merged_params = default_chat_params.copy()
+        merged_params.update(kwargs)
+
+        if coalescer is not None:
+            return await coalescer.submit(merged_params)
+        return await original_create(**merged_params)
+
+    return create
+
+
 class OpenAICompatibleWrapper:
     """
     A wrapper class to extend the functionality of a given base class by customizing
@@ -7,52 +62,83 @@ class OpenAICompatibleWrapper:
     Attributes:
         base_client (object): An instance of the base class provided to the wrapper.
         default_chat_params (dict): Default parameters for chat completions.
+        chat (object): The `chat` resource of the base client, kept on the wrapper to skip `__getattr__`.
         __original_create (function): A reference to the original `create` method of the base class.
+        __coalescer (RequestCoalescer): Batches identical async requests, or None when batching is disabled.
 
     Methods:
-        __create(**kwargs):
-            Merges the default parameters with the provided ones and calls the original `create` method.
-
         __getattr__(name):
             Delegates attribute access to the wrapped client instance.
 
     Args:
-        base (type): The base class to wrap (e.g., OpenAI or AzureOpenAI).
+        base (type): The base class to wrap (e.g., OpenAI, AzureOpenAI or AsyncOpenAI).
+        batch_window_ms (float): How long identical async requests are held to be sent as one request. 0 disables batching.
+        batch_size (int): The number of identical async requests at which a batch is sent immediately.
         **chat_params (dict): Default parameters to be used for chat completions.
     """
-    
-    def __init__(self, base, **chat_params):
+
+    # Wrapper state lives in slots; `__dict__` is kept so callers and subclasses can still set their own attributes
+    __slots__ = ('base_client', '__default_chat_params', 'chat', '__original_create', '__coalescer', '__dict__')
+
+    def __init__(self, base, batch_window_ms=0, batch_size=1, **chat_params):
         """
         Initializes the OpenAIWrapper with a base class and default chat parameters.
 
         Args:
             base (type): The class to wrap (e.g., OpenAI or AzureOpenAI).
+            batch_window_ms (float): How long identical async requests are held to be sent as one request.
+                                     0 disables batching.
+            batch_size (int): The number of identical async requests at which a batch is sent immediately.
             **chat_params (dict): Default parameters to be used for chat completions.
+
+        Raises:
+            ValueError: If batching is requested for a synchronous base client.
         """
         self.base_client = base()
-        self.default_chat_params = chat_params
-        
+        self.__default_chat_params = chat_params
+
+        # `chat` is needed below anyway; other resources stay lazy behind `__getattr__`
+        self.chat = self.base_client.chat
+
         # Backup the original method
-        self.__original_create = self.base_client.chat.completions.create
-        
-        # Replace the original method with the wrapped one
-        self.base_client.chat.completions.create = self.__create
+        self.__original_create = self.chat.completions.create
 
-    def __create(self, **kwargs):
-        """
-        Merges the default parameters with the provided ones and calls the original `create` method.
+        # Replace the original method with the wrapped one, keeping it awaitable for async clients.
+        # The client's `create` is wrapped by a sync decorator, so check the unwrapped function.
+        is_async = inspect.iscoroutinefunction(inspect.unwrap(self.__original_create))
 
-        This method is used as a replacement for the original `create` method in `chat.completions`.
-        It ensures that default parameters are always included, while additional parameters can still be passed.
+        self.__coalescer = None
+        if batch_window_ms > 0 and batch_size > 1:
+            if not is_async:
+                raise ValueError("Request batching requires an asynchronous base client (e.g., AsyncOpenAI).")
+            self.__coalescer = RequestCoalescer(self.__original_create, batch_window_ms, batch_size)
 
-        Args:
-            **kwargs (dict): Additional parameters to override or extend the default chat parameters.
+        if is_async:
+            create = _bind_acreate(self.__original_create, self.__default_chat_params, self.__coalescer)
+        else:
+            create = _bind_create(self.__original_create, self.__default_chat_params)
+        self.chat.completions.create = create
+
+    @property
+    def default_chat_params(self):
+        """
+        Default parameters for chat completions.
+
+        The wrapped `create` holds on to this dict, so assigning new defaults replaces its
+        contents in place; updating the dict directly works as well.
 
         Returns:
-            Response: The response from the original `create` method after completing the chat request.
+            dict: The default chat completion parameters.
         """
-        merged_params = {**self.default_chat_params, **kwargs}
-        return self.__original_create(**merged_params)
+        return self.__default_chat_params
+
+    @default_chat_params.setter
+    def default_chat_params(self, value):
+        # Copy first so assigning the dict to itself does not clear it
+        value = dict(value)
+        default_chat_params = self.__default_chat_params
+        default_chat_params.clear()
+        default_chat_params.update(value)
 
     def __getattr__(self, name):
         """
@@ -60,11 +146,19 @@ class OpenAICompatibleWrapper:
 
         This method allows the wrapper to forward any attribute lookup (such as methods or properties)
         to the underlying base client instance, enabling seamless interaction with the original class.
+        `chat` is set on the instance and never reaches it.
 
         Args:
             name (str): The name of the attribute being accessed.
 
         Returns:
             The value of the requested attribute from the base client instance.
+
+        Raises:
+            AttributeError: If the attribute does not exist, including `base_client` itself when it has
+                            not been set yet (e.g., during unpickling or a failed `__init__`).
         """
+        # An unset `base_client` would otherwise recurse back into `__getattr__`
+        if name == 'base_client':
+            raise AttributeError(name)
         return getattr(self.base_client, name)
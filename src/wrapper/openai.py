@@ -17,9 +17,6 @@ class OpenAIWrapper(OpenAICompatibleWrapper):
         __original_create (function): A reference to the original create method for chat completions in OpenAI.
 
     Methods:
-        __create(**kwargs):
-            Merges the default parameters with the provided ones and calls the original create method.
-
         __getattr__(name):
             Delegates attribute access to the underlying OpenAI client instance.
     